@@ -45,6 +45,9 @@ TRANSCRIPT_DIR = os.path.join(DATA_DIR, "transcripts")
 SUMMARY_DIR = os.path.join(DATA_DIR, "summaries")
 LOG_DIR = os.path.join(PROJECT_ROOT, "logs")
 CHROMA_DIR = os.path.join(DATA_DIR, "chroma")
+EMBEDDING_CACHE_PATH = os.path.join(DATA_DIR, "embedding_cache.db")  # Query embeddings kept across restarts
+EMBEDDING_CACHE_MAX_ROWS = 10000  # Oldest query embeddings are dropped beyond this
+EMBEDDING_CACHE_DIGEST_TTL_SEC = 60  # How long a model's digest is trusted before re-checking /api/tags
 
 # Create all directories at once
 for directory in [DATA_DIR, TRANSCRIPT_DIR, SUMMARY_DIR, LOG_DIR, CHROMA_DIR]:
@@ -56,6 +59,8 @@ for directory in [DATA_DIR, TRANSCRIPT_DIR, SUMMARY_DIR, LOG_DIR, CHROMA_DIR]:
 
 # ChromaDB settings
 CHROMA_DB_IMPL = "duckdb+parquet"
+CHROMA_SUMMARY_CACHE_TTL_SEC = 60  # How long get_all_summaries results are reused
+CHROMA_TRANSCRIPT_CACHE_TTL_SEC = 60  # How long get_all_transcripts results are reused
 
 ########################
 # MODEL SETTINGS
@@ -101,6 +106,7 @@ OLLAMA_EMBEDDINGS_URL = f"{OLLAMA_BASE_URL}/api/embeddings"
 
 # Ollama API settings
 OLLAMA_STREAM = False  # Whether to stream responses from Ollama
+OLLAMA_KEEP_ALIVE = "10m"  # Keep the model (and its cached prompt prefix) loaded between streamed requests
 
 ########################
 # UI SETTINGS
@@ -113,6 +119,10 @@ UI_LAYOUT = "wide"
 UI_SIDEBAR_STATE = "expanded"
 #UI_DEFAULT_MODELS = ["phi4", "llama3", "mistral", "codellama"]
 UI_DEFAULT_MODEL = OLLAMA_MODEL
+UI_STREAM_FLUSH_TOKENS = 16  # Streamed tokens to buffer before updating the chat
+UI_CHAT_CONCURRENCY = 4  # Chat turns answered at once; Ollama batches concurrent requests (OLLAMA_NUM_PARALLEL)
+UI_MODEL_LIST_TTL_SEC = 60  # How long the Ollama model list is reused before re-querying
+UI_OLLAMA_FAILURE_TTL_SEC = 5  # After a failed connect to Ollama, fail fast for this long instead of reconnecting
 
 ########################
 # SEARCH SETTINGS
@@ -123,6 +133,13 @@ SEARCH_DEFAULT_TOP_K = 5
 SEARCH_MIN_RELEVANCE = 0.7  # Minimum relevance score (0-1)
 SEARCH_HIGHLIGHT_THRESHOLD = 3  # Minimum characters for keyword highlighting
 
+# Semantic cache for near-duplicate search queries
+SEARCH_SEMANTIC_CACHE_ENABLED = True  # Reuse answers of earlier queries with the same keywords and a near-identical embedding
+SEARCH_SEMANTIC_CACHE_SIZE = 256  # Cached search results per model
+SEARCH_SEMANTIC_CACHE_THRESHOLD = 0.95  # Minimum cosine similarity for a cache hit
+SEARCH_SEMANTIC_CACHE_TTL_SEC = 900  # Expire cached results so new summaries show up (one summary interval)
+SEARCH_PREFETCH_FOLLOW_UPS = 0  # Predicted follow-up queries to prefetch after an answer; each one is a full RAG generation (0 disables)
+
 ########################
 # TIMING SETTINGS
 ########################
@@ -193,5 +210,13 @@ RAG_DATE_FORMAT = "Date: {timestamp}\n"
 RAG_SUMMARY_FORMAT = "Summary: {summary}\n"
 RAG_FINAL_INSTRUCTION = "\nPlease provide a professional and helpful response using only the provided documents. Prioritize exact matches and explicitly reference relevant documents. If no relevant information is found, clearly state that."
 
+# Prompt for predicting follow-up questions to prefetch
+RAG_FOLLOW_UP_PROMPT = """Here is a question and the answer it received:
+Question: {query}
+Answer: {answer}
+
+List {count} short follow-up questions the user is likely to ask next about their past conversations.
+Respond with one question per line and no numbering or extra text."""
+
 # RAG relevance calculation
 RAG_RELEVANCE_FACTOR = 100  # Multiply (1 - distance) by this factor
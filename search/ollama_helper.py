@@ -13,12 +13,15 @@ Role in the system:
 Used primarily by search_engine.py for enhanced search results.
 """
 
-import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import logging
 import sys
 import os
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -26,12 +29,94 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 # Import config
 from config import (
     OLLAMA_URL, OLLAMA_MODEL, OLLAMA_TEMPERATURE, OLLAMA_MAX_TOKENS,
-    OLLAMA_RAG_SYSTEM_PROMPT, OLLAMA_STREAM, logger,
+    OLLAMA_RAG_SYSTEM_PROMPT, OLLAMA_STREAM, OLLAMA_KEEP_ALIVE, UI_OLLAMA_FAILURE_TTL_SEC, logger,
     RAG_QUERY_PREFIX, RAG_CONTEXT_HEADER, RAG_DOCUMENT_HEADER,
     RAG_DATE_FORMAT, RAG_SUMMARY_FORMAT, RAG_FINAL_INSTRUCTION,
     RAG_RELEVANCE_FACTOR
 )
 
+RAG_NO_RESULTS_MESSAGE = "I couldn't find any relevant information to answer your question."
+OLLAMA_UNAVAILABLE_MESSAGE = "Error: Could not connect to the LLM. Please ensure Ollama is running."
+
+class OllamaStreamError(Exception):
+    """Raised when a streamed Ollama response fails; str() is the message to show."""
+    pass
+
+# Keep-alive connections to Ollama, shared by the search and web modules.
+# Retries only cover failed connects; a started generation is never resent.
+OLLAMA_SESSION = requests.Session()
+OLLAMA_SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.1)
+))
+
+# Monotonic time until which Ollama is treated as down after a failed connect
+_failure_until = 0.0
+
+def ollama_down() -> bool:
+    """True while a recent connection failure says not to try Ollama again yet."""
+    return time.monotonic() < _failure_until
+
+def record_ollama_connection(ok: bool) -> None:
+    """Clear the failure window on success, or open one after a failed connect."""
+    global _failure_until
+    _failure_until = 0.0 if ok else time.monotonic() + UI_OLLAMA_FAILURE_TTL_SEC
+
+def stream_generate(payload: Dict[str, Any]) -> Iterator[str]:
+    """
+    Stream a generation from Ollama, yielding the response text as it arrives.
+    
+    Closing the iterator early closes the request, so Ollama stops generating.
+    
+    Args:
+        payload: /api/generate request body; "stream" and "keep_alive" are
+            filled in unless given
+        
+    Yields:
+        Response text chunks from Ollama
+        
+    Raises:
+        OllamaStreamError: If the request fails, possibly after some chunks
+            were already yielded
+    """
+    if ollama_down():
+        raise OllamaStreamError(OLLAMA_UNAVAILABLE_MESSAGE)
+    
+    try:
+        # Fail fast on connect, but no read timeout: loading a model can take a while
+        with OLLAMA_SESSION.post(
+            OLLAMA_URL,
+            headers={"Content-Type": "application/json"},
+            data=orjson.dumps({"stream": True, "keep_alive": OLLAMA_KEEP_ALIVE, **payload}),
+            stream=True,
+            timeout=(3, None)
+        ) as response:
+            record_ollama_connection(True)
+            if response.status_code != 200:
+                logger.error(f"Ollama API error: {response.status_code}, {response.text}")
+                raise OllamaStreamError(f"Error querying Ollama: {response.status_code}")
+            
+            # Ollama streams one JSON object per line
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = orjson.loads(line)
+                if chunk.get("response"):
+                    yield chunk["response"]
+                if chunk.get("done"):
+                    break
+    
+    except OllamaStreamError:
+        raise
+    except requests.exceptions.ConnectionError as e:
+        record_ollama_connection(False)
+        logger.error(f"Could not connect to Ollama: {str(e)}")
+        raise OllamaStreamError(OLLAMA_UNAVAILABLE_MESSAGE) from e
+    except Exception as e:
+        logger.error(f"Exception when streaming from Ollama API: {str(e)}")
+        raise OllamaStreamError(f"Error: {str(e)}") from e
+
 def get_embedding(text: str, model: str = OLLAMA_MODEL) -> List[float]:
     """
     Generate embeddings for a given text using the Ollama API.
@@ -64,6 +149,38 @@ def get_embedding(text: str, model: str = OLLAMA_MODEL) -> List[float]:
         logger.error(f"Exception when calling Ollama embedding API: {str(e)}")
         return []
 
+def get_model_digest(model: str = OLLAMA_MODEL) -> Optional[str]:
+    """
+    Look up the digest of an installed model using the Ollama API.
+    
+    The digest changes whenever a tag is re-pulled, so it identifies the
+    exact weights behind an embedding.
+    
+    Args:
+        model: The Ollama model name, with or without a tag
+        
+    Returns:
+        The digest string, or None if the model isn't installed or on error.
+    """
+    try:
+        url = OLLAMA_URL.replace("/api/generate", "/api/tags")
+        response = requests.get(url, timeout=5)
+        
+        if response.status_code != 200:
+            logger.error(f"Ollama tags API error: {response.status_code}, {response.text}")
+            return None
+        
+        # Untagged names refer to the ":latest" tag
+        names = {model, model if ":" in model else f"{model}:latest"}
+        for entry in response.json().get("models", []):
+            if entry.get("name") in names or entry.get("model") in names:
+                return entry.get("digest")
+        return None
+            
+    except Exception as e:
+        logger.error(f"Exception when calling Ollama tags API: {str(e)}")
+        return None
+
 def query_ollama(system_prompt, user_prompt, model=OLLAMA_MODEL, temperature=OLLAMA_TEMPERATURE, max_tokens=OLLAMA_MAX_TOKENS):
     """
     Query the Ollama API with RAG context.
@@ -105,14 +222,45 @@ def query_ollama(system_prompt, user_prompt, model=OLLAMA_MODEL, temperature=OLL
         logger.error(f"Exception when calling Ollama API: {str(e)}")
         return f"Error: {str(e)}"
 
-def rag_search(query: str, results: List[Dict[str, Any]], model: str = OLLAMA_MODEL) -> str:
+def query_ollama_stream(system_prompt, user_prompt, model=OLLAMA_MODEL, temperature=OLLAMA_TEMPERATURE, max_tokens=OLLAMA_MAX_TOKENS) -> Iterator[str]:
     """
-    Perform RAG search using Ollama.
+    Query the Ollama API with RAG context, yielding the response as it is generated.
+    
+    Args:
+        system_prompt: The system prompt to set context
+        user_prompt: The user query with RAG content
+        model: Ollama model to use
+        temperature: Sampling temperature (higher = more creative)
+        max_tokens: Maximum tokens to generate
+        
+    Yields:
+        Response text chunks from Ollama
+        
+    Raises:
+        OllamaStreamError: If the request fails, possibly after some chunks
+            were already yielded
     """
-    # Add this to your rag_search function to help debug
-    import logging
-    logger = logging.getLogger(__name__)
+    prompt = f"{system_prompt}\n\n{user_prompt}"
+    
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "options": {
+            "temperature": temperature,
+            "num_predict": max_tokens
+        }
+    }
+    
+    logger.info(f"Streaming from Ollama with model: {model}")
+    yield from stream_generate(payload)
 
+def build_rag_prompt(query: str, results: List[Dict[str, Any]]) -> Optional[Tuple[str, str]]:
+    """
+    Build the system and user prompts for a RAG query.
+    
+    Returns:
+        (system_prompt, user_prompt), or None if no result has usable content.
+    """
     logger.info(f"RAG Query: '{query}'")
     
     # Extract content from results and ensure we have valid content
@@ -150,9 +298,9 @@ def rag_search(query: str, results: List[Dict[str, Any]], model: str = OLLAMA_MO
     else:
         logger.info("No documents found")
     
-    # If no valid documents found, return error message
+    # If no valid documents found, there is nothing to ground the answer in
     if not documents:
-        return "I couldn't find any relevant information to answer your question."
+        return None
     
     # Sort documents by relevance
     documents.sort(key=lambda x: x["relevance"], reverse=True)
@@ -168,7 +316,28 @@ def rag_search(query: str, results: List[Dict[str, Any]], model: str = OLLAMA_MO
     # Create full prompt
     system_prompt = OLLAMA_RAG_SYSTEM_PROMPT
     user_prompt = f"{RAG_QUERY_PREFIX}{query}{context}{RAG_FINAL_INSTRUCTION}"
+    return system_prompt, user_prompt
+
+def rag_search(query: str, results: List[Dict[str, Any]], model: str = OLLAMA_MODEL) -> str:
+    """
+    Perform RAG search using Ollama.
+    """
+    prompts = build_rag_prompt(query, results)
+    if prompts is None:
+        return RAG_NO_RESULTS_MESSAGE
+    
+    system_prompt, user_prompt = prompts
+    return query_ollama(system_prompt, user_prompt, model=model)
+
+def rag_search_stream(query: str, results: List[Dict[str, Any]], model: str = OLLAMA_MODEL) -> Iterator[str]:
+    """
+    Perform RAG search using Ollama, yielding the answer as it is generated.
+    Raises OllamaStreamError like query_ollama_stream.
+    """
+    prompts = build_rag_prompt(query, results)
+    if prompts is None:
+        yield RAG_NO_RESULTS_MESSAGE
+        return
     
-    # Generate response
-    response = query_ollama(system_prompt, user_prompt, model=model)
-    return response
\ No newline at end of file
+    system_prompt, user_prompt = prompts
+    yield from query_ollama_stream(system_prompt, user_prompt, model=model)
\ No newline at end of file
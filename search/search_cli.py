@@ -24,13 +24,10 @@ sys.path.append(parent_dir)
 
 # Fix the imports
 from utils.summarize import generate_embedding
-from storage.chroma_store import search_summaries, initialize_chroma  # Add initialize_chroma
+from storage.chroma_store import search_summaries, initialize_chroma
 from setup.logger import logger
 from search.search import search_transcripts
 
-# Force ChromaDB initialization when running CLI
-initialize_chroma(force=True)
-
 def search_by_text(query_text, top_k=5):
     """
     Search for summaries similar to the query text.
@@ -72,6 +69,9 @@ def main():
     print("\nJarvis Semantic Search")
     print("======================\n")
     
+    # No-op when the client was already built on import
+    initialize_chroma()
+    
     # Check if ChromaDB has data
     check_chroma_data()
     
@@ -15,7 +15,8 @@ Primary entry point for advanced search operations in the web interface and API.
 
 import sys
 import os
-from typing import List, Dict, Any, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Union
 import re
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -25,6 +26,9 @@ from setup.logger import logger
 # Import the correct model configuration
 from config import OLLAMA_MODEL  # Use this existing configuration value
 
+# Shared pool so keyword and vector retrieval run side by side
+_search_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="search")
+
 def normalize_search_results(results):
     """
     Normalize search results to have a consistent structure.
@@ -60,6 +64,10 @@ def normalize_search_results(results):
         normalized.append(normalized_result)
     return normalized
 
+def extract_keywords(query: str) -> List[str]:
+    """Extract the lowercased keywords (words longer than 2 chars) of a query."""
+    return [word.lower() for word in re.findall(r'\b\w+\b', query) if len(word) > 2]
+
 def search_by_keywords(query: str, summaries: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """
     Perform a basic keyword search on summaries when vector search is insufficient.
@@ -79,7 +87,7 @@ def search_by_keywords(query: str, summaries: List[Dict[str, Any]] = None) -> Li
         logger.info(f"Retrieved {len(summaries)} summaries from ChromaDB")
     
     # Extract keywords (words longer than 2 chars to include more matches)
-    keywords = [word.lower() for word in re.findall(r'\b\w+\b', query) if len(word) > 2]
+    keywords = extract_keywords(query)
     results = []
     
     # Add error checking for empty or invalid summaries
@@ -125,11 +133,40 @@ def search_by_keywords(query: str, summaries: List[Dict[str, Any]] = None) -> Li
     # Normalize results structure before returning
     return normalize_search_results(results[:15])  # Return top 15 results
 
+def _vector_search(embedding: List[float], top_k: int) -> List[Dict[str, Any]]:
+    """
+    Run the Chroma vector search and normalize its results.
+    
+    Returns an empty list on failure so keyword results can still be used.
+    """
+    try:
+        raw_vector_results = search_summaries(embedding, top_k=top_k)
+        
+        # Log the raw structure before normalization to help debug
+        if raw_vector_results and len(raw_vector_results) > 0:
+            logger.debug(f"Raw vector result keys: {list(raw_vector_results[0].keys())}")
+            
+        # Normalize vector results
+        vector_results = normalize_search_results(raw_vector_results)
+        logger.info(f"Vector search found {len(vector_results)} results")
+        return vector_results
+    except Exception as e:
+        logger.error(f"Vector search failed: {str(e)}")
+        return []
+
+def submit_keyword_search(query: str) -> Future:
+    """
+    Start a keyword search in the background, e.g. while the query is still
+    being embedded. Pass the returned future to unified_search.
+    """
+    return _search_executor.submit(search_by_keywords, query)
+
 def unified_search(query: str, 
                    embedding: List[float], 
                    top_k: int = 5, 
                    use_rag: bool = True,
-                   model: str = OLLAMA_MODEL) -> Dict[str, Any]:
+                   model: str = OLLAMA_MODEL,
+                   keyword_future: Optional[Future] = None) -> Dict[str, Any]:
     """
     Unified search function that combines vector search with optional RAG.
     
@@ -139,6 +176,8 @@ def unified_search(query: str,
         top_k: Number of results to return
         use_rag: Whether to use RAG to enhance results
         model: Which model to use for RAG (defaults to OLLAMA_MODEL from config)
+        keyword_future: Keyword search already started with
+            submit_keyword_search for this query
         
     Returns:
         Dictionary containing search results and RAG response if applicable
@@ -146,25 +185,20 @@ def unified_search(query: str,
     logger.debug(f"Search query: '{query}', top_k={top_k}, use_rag={use_rag}")
     
     try:
-        # Try keyword search first since we know it works reliably
-        keyword_results = search_by_keywords(query)
-        
-        # Try vector search as well if we have an embedding
-        vector_results = []
-        if embedding is not None:
-            try:
-                raw_vector_results = search_summaries(embedding, top_k=top_k)
-                
-                # Log the raw structure before normalization to help debug
-                if raw_vector_results and len(raw_vector_results) > 0:
-                    logger.debug(f"Raw vector result keys: {list(raw_vector_results[0].keys())}")
-                    
-                # Normalize vector results
-                vector_results = normalize_search_results(raw_vector_results)
-                logger.info(f"Vector search found {len(vector_results)} results")
-            except Exception as e:
-                logger.error(f"Vector search failed: {str(e)}")
-                # Continue with keyword results if vector search fails
+        # Keyword search always runs; vector search runs alongside it if we have an embedding
+        if embedding is None and keyword_future is None:
+            # Keyword-only (e.g. perform_search): nothing to overlap, so skip the pool hop
+            keyword_results = search_by_keywords(query)
+            vector_results = []
+        else:
+            if keyword_future is None:
+                keyword_future = submit_keyword_search(query)
+            vector_future = None
+            if embedding is not None:
+                vector_future = _search_executor.submit(_vector_search, embedding, top_k)
+            
+            keyword_results = keyword_future.result()
+            vector_results = vector_future.result() if vector_future else []
         
         # Combine results if both methods returned something
         if keyword_results and vector_results:
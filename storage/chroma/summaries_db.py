@@ -13,16 +13,25 @@ Role in the system:
 Used by chroma_store.py to manage summary data in the vector database.
 """
 import json
+import time
 import uuid
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Union
 from setup.logger import logger
 from storage.chroma.client import get_collections, is_test_mode
+import config
 
 class SummaryError(Exception):
     """Exception for summary-related errors."""
     pass
 
+# Cached get_all() results: limit -> (collection count, fetch time, results)
+_all_summaries_cache = {}
+
+def clear_cache() -> None:
+    """Forget cached get_all() results after the collection changes."""
+    _all_summaries_cache.clear()
+
 def add_summary(
     embedding: List[float], 
     summary_text: str, 
@@ -81,6 +90,7 @@ def add_summary(
             metadatas=[metadata],
             ids=[embedding_id]
         )
+        clear_cache()
         #logger.info(f"Added summary embedding to ChromaDB with ID: {embedding_id}")
         logger.debug(f"Summary metadata: {metadata}")
         return embedding_id
@@ -105,6 +115,14 @@ def get_all(limit: int = 100) -> List[Dict[str, Any]]:
         return []
     
     try:
+        # Reuse a recent fetch while the collection size is unchanged; count()
+        # is cheap and also catches writes made by other processes
+        count = summaries_collection.count()
+        cached = _all_summaries_cache.get(limit)
+        if cached and cached[0] == count and time.monotonic() - cached[1] < config.CHROMA_SUMMARY_CACHE_TTL_SEC:
+            logger.debug(f"Using cached summaries ({len(cached[2])})")
+            return list(cached[2])
+        
         logger.debug(f"Retrieving up to {limit} summaries from ChromaDB")
         
         # Get all embeddings
@@ -122,8 +140,9 @@ def get_all(limit: int = 100) -> List[Dict[str, Any]]:
             
         # Add this log line to match the transcript retrieval log format
         logger.info(f"Retrieved {len(formatted_results)} summaries from ChromaDB")
-            
-        return formatted_results
+        
+        _all_summaries_cache[limit] = (count, time.monotonic(), formatted_results)
+        return list(formatted_results)
     except Exception as e:
         logger.error(f"Error getting summaries from ChromaDB: {e}", exc_info=True)
         return []
@@ -179,30 +198,47 @@ def delete_by_id(summary_id: str) -> bool:
     Returns:
         bool: True if deletion was successful
     """
+    return delete_by_ids([summary_id])
+
+def delete_by_ids(summary_ids: List[str]) -> bool:
+    """
+    Delete several summaries in a single ChromaDB call.
+    
+    Args:
+        summary_ids: The IDs of the summaries to delete
+    
+    Returns:
+        bool: True if deletion was successful
+    """
+    if not summary_ids:
+        return True
+    
     summaries_collection, _ = get_collections()
     
-    logger.info(f"Deleting summary with ID: {summary_id}")
+    logger.info(f"Deleting summaries with IDs: {summary_ids}")
     
     # Try with existing collection first
     if summaries_collection is not None:
         try:
-            summaries_collection.delete(ids=[summary_id])
-            logger.info(f"Successfully deleted summary {summary_id}")
+            summaries_collection.delete(ids=list(summary_ids))
+            clear_cache()
+            logger.info(f"Successfully deleted summaries {summary_ids}")
             return True
         except Exception as e:
-            logger.error(f"Error deleting summary: {str(e)}", exc_info=True)
+            logger.error(f"Error deleting summaries: {str(e)}", exc_info=True)
     
     # If we get here, try a fallback method
     try:
         import chromadb
         import config
         
-        logger.debug("Using fallback method to delete summary")
+        logger.debug("Using fallback method to delete summaries")
         client = chromadb.PersistentClient(path=config.CHROMA_DIR)
         collection = client.get_collection(name="summaries")
-        collection.delete(ids=[summary_id])
-        logger.info(f"Successfully deleted summary {summary_id} using fallback method")
+        collection.delete(ids=list(summary_ids))
+        clear_cache()
+        logger.info(f"Successfully deleted summaries {summary_ids} using fallback method")
         return True
     except Exception as e:
-        logger.error(f"Error in fallback deletion for summary: {str(e)}", exc_info=True)
+        logger.error(f"Error in fallback deletion for summaries: {str(e)}", exc_info=True)
         raise SummaryError(f"Failed to delete conversation: {str(e)}")
\ No newline at end of file
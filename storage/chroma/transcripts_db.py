@@ -12,16 +12,25 @@ Role in the system:
 
 Used by chroma_store.py to manage transcript data in the vector database.
 """
+import time
 import uuid
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Union
 from setup.logger import logger
 from storage.chroma.client import get_collections
+import config
 
 class TranscriptError(Exception):
     """Exception for transcript-related errors."""
     pass
 
+# Cached get_all() results: limit -> (collection count, fetch time, results)
+_all_transcripts_cache = {}
+
+def clear_cache() -> None:
+    """Forget cached get_all() results after the collection changes."""
+    _all_transcripts_cache.clear()
+
 def get_all(limit: int = 1000) -> List[Dict[str, Any]]:
     """
     Get all transcripts stored in ChromaDB, up to the specified limit.
@@ -39,6 +48,13 @@ def get_all(limit: int = 1000) -> List[Dict[str, Any]]:
         return []
     
     try:
+        # Same reuse rule as summaries: unchanged count and a recent fetch
+        count = transcripts_collection.count()
+        cached = _all_transcripts_cache.get(limit)
+        if cached and cached[0] == count and time.monotonic() - cached[1] < config.CHROMA_TRANSCRIPT_CACHE_TTL_SEC:
+            logger.debug(f"Using cached transcripts ({len(cached[2])})")
+            return list(cached[2])
+        
         logger.debug(f"Retrieving up to {limit} transcripts from ChromaDB")
         
         # Get all transcripts with their metadata
@@ -55,7 +71,8 @@ def get_all(limit: int = 1000) -> List[Dict[str, Any]]:
             formatted_results.append(formatted_result)
             
         #logger.info(f"Retrieved {len(formatted_results)} transcripts from ChromaDB")
-        return formatted_results
+        _all_transcripts_cache[limit] = (count, time.monotonic(), formatted_results)
+        return list(formatted_results)
     except Exception as e:
         logger.error(f"Error getting transcripts from ChromaDB: {e}", exc_info=True)
         return []
@@ -116,6 +133,7 @@ def add_transcript(
                 ids=[transcript_id]
             )
             
+        clear_cache()
         logger.debug(f"Added transcript to ChromaDB with ID: {transcript_id}")
         return transcript_id
     except Exception as e:
@@ -132,6 +150,22 @@ def delete_related_to_summary(summary_id: str) -> int:
     Returns:
         int: Number of transcripts deleted
     """
+    return delete_related_to_summaries([summary_id])
+
+def delete_related_to_summaries(summary_ids: List[str]) -> int:
+    """
+    Delete transcripts related to any of several summaries, scanning the
+    collection once.
+    
+    Args:
+        summary_ids: The IDs of the summaries
+        
+    Returns:
+        int: Number of transcripts deleted
+    """
+    if not summary_ids:
+        return 0
+    
     _, transcripts_collection = get_collections()
     
     if transcripts_collection is None:
@@ -139,7 +173,7 @@ def delete_related_to_summary(summary_id: str) -> int:
         return 0
     
     try:
-        logger.debug(f"Finding transcripts related to summary {summary_id}")
+        logger.debug(f"Finding transcripts related to summaries {summary_ids}")
         
         # Get all transcript IDs
         transcript_results = transcripts_collection.get()
@@ -155,13 +189,14 @@ def delete_related_to_summary(summary_id: str) -> int:
         # Find related transcripts by ID pattern
         related_transcript_ids = [
             t_id for t_id in transcript_ids 
-            if summary_id in t_id  # Simple matching - if summary ID is part of transcript ID
+            if any(summary_id in t_id for summary_id in summary_ids)  # Simple matching - if summary ID is part of transcript ID
         ]
         
-        logger.debug(f"Found {len(related_transcript_ids)} transcript(s) related to summary {summary_id}")
+        logger.debug(f"Found {len(related_transcript_ids)} transcript(s) related to summaries {summary_ids}")
         
         if related_transcript_ids:
             transcripts_collection.delete(ids=related_transcript_ids)
+            clear_cache()
             logger.info(f"Deleted {len(related_transcript_ids)} related transcript entries")
             return len(related_transcript_ids)
         
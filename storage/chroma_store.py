@@ -58,6 +58,13 @@ def delete_summary_by_id(summary_id):
         transcripts_db.delete_related_to_summary(summary_id)
     return success
 
+def delete_summaries_by_ids(summary_ids):
+    """Delete several summaries and their related transcripts in one call each."""
+    success = summaries_db.delete_by_ids(summary_ids)
+    if success:
+        transcripts_db.delete_related_to_summaries(summary_ids)
+    return success
+
 def get_all_transcripts(limit=1000):
     """Get all transcripts from ChromaDB."""
     # Update this reference to the renamed file
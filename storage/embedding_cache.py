@@ -0,0 +1,92 @@
+"""
+Persistent Embedding Cache Module
+
+This module stores query embeddings on disk so they survive application
+restarts, avoiding a round-trip to Ollama for queries seen in earlier sessions.
+
+Role in the system:
+- Keeps (model, digest, text) -> embedding rows in a small SQLite database
+- Drops a model's rows once its digest changes (e.g. after `ollama pull`)
+- Caps the table at EMBEDDING_CACHE_MAX_ROWS, dropping the oldest rows first
+- Stores vectors compactly as float32 bytes
+- Serializes access so it can be shared by Gradio's worker threads
+- Fails soft: cache errors are logged and treated as misses
+
+Used by the web search handler underneath its in-memory LRU cache.
+"""
+
+import sqlite3
+import threading
+from typing import List, Optional
+import numpy as np
+
+from config import EMBEDDING_CACHE_PATH, EMBEDDING_CACHE_MAX_ROWS
+from setup.logger import logger
+
+_connection = None
+_lock = threading.Lock()
+
+def _get_connection():
+    """Open the cache database on first use."""
+    global _connection
+
+    if _connection is None:
+        _connection = sqlite3.connect(EMBEDDING_CACHE_PATH, check_same_thread=False)
+        _connection.execute(
+            "CREATE TABLE IF NOT EXISTS query_embeddings ("
+            "model TEXT NOT NULL, digest TEXT NOT NULL, text TEXT NOT NULL, "
+            "embedding BLOB NOT NULL, PRIMARY KEY (model, digest, text))"
+        )
+        _connection.commit()
+    return _connection
+
+def get_embedding(model: str, digest: str, text: str) -> Optional[List[float]]:
+    """
+    Look up a stored embedding made by the given model weights.
+
+    Returns:
+        The embedding as a list of floats, or None if it isn't cached.
+    """
+    try:
+        with _lock:
+            row = _get_connection().execute(
+                "SELECT embedding FROM query_embeddings WHERE model = ? AND digest = ? AND text = ?",
+                (model, digest, text)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.error(f"Error reading embedding cache: {e}")
+        return None
+
+    if row is None:
+        return None
+    return np.frombuffer(row[0], dtype=np.float32).tolist()
+
+def put_embedding(model: str, digest: str, text: str, embedding: List[float]) -> None:
+    """
+    Store an embedding, replacing any previous entry for the same query.
+
+    Rows for other digests of the same model are dropped, and the oldest
+    rows are removed once the table exceeds EMBEDDING_CACHE_MAX_ROWS.
+    """
+    blob = np.asarray(embedding, dtype=np.float32).tobytes()
+    try:
+        with _lock:
+            connection = _get_connection()
+            connection.execute(
+                "DELETE FROM query_embeddings WHERE model = ? AND digest != ?",
+                (model, digest)
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO query_embeddings (model, digest, text, embedding) VALUES (?, ?, ?, ?)",
+                (model, digest, text, blob)
+            )
+            # Replaced rows get a new rowid, so the lowest rowids are the oldest writes
+            connection.execute(
+                "DELETE FROM query_embeddings WHERE rowid IN ("
+                "SELECT rowid FROM query_embeddings ORDER BY rowid "
+                "LIMIT max(0, (SELECT COUNT(*) FROM query_embeddings) - ?))",
+                (EMBEDDING_CACHE_MAX_ROWS,)
+            )
+            connection.commit()
+    except sqlite3.Error as e:
+        logger.error(f"Error writing embedding cache: {e}")
@@ -7,6 +7,8 @@ class ToolManager:
         self.tool_dir = tool_dir
         self.logger = logging.getLogger(__name__)
         self.tools = self._discover_tools()
+        # The instructions only depend on the tools, so build them once
+        self._tool_prompt_prefix = self._build_tool_prompt_prefix()
 
     def _discover_tools(self):
         tool_registry = {}
@@ -28,6 +30,17 @@ class ToolManager:
         return self.tools
 
     def get_tool_prompt(self, user_message):
+        if not self._tool_prompt_prefix:
+            return None
+
+        # The user message goes last so every routing prompt shares the same
+        # prefix, which Ollama can reuse from its KV cache instead of re-reading
+        prompt = self._tool_prompt_prefix + f'\n\nUser message: "{user_message}"\n'
+
+        self.logger.debug(f"Generated tool prompt:\n{prompt}")
+        return prompt
+
+    def _build_tool_prompt_prefix(self):
         if not self.tools:
             return None
 
@@ -38,8 +51,7 @@ class ToolManager:
         prompt += "Available tools:\n"
         for name, schema in self.tools.items():
             prompt += f"{name}: {schema['description']}\n"
-            
-        prompt += f'\nUser message: "{user_message}"\n\n'
+        prompt += "\n"
         
         # Collect all possible input parameters from all tools
         all_params = set()
@@ -108,5 +120,4 @@ class ToolManager:
              prompt += f', "{param}": null'
         prompt += '}'
 
-        self.logger.debug(f"Generated tool prompt:\n{prompt}")
         return prompt
\ No newline at end of file
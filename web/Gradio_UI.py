@@ -5,11 +5,12 @@ import sys
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from web_utils.session import initialize_session_state
-from components.gradio_chat import create_gradio_chat_interface
-from components.gradio_recorder_controls import create_recorder_controls
-from components.gradio_model_selector import create_model_selector
-from components.gradio_conversation_timeline import create_conversation_timeline_interface
+from web.web_utils.session import initialize_session_state
+from web.web_utils.search_handler import warm_up_embeddings
+from web.components.gradio_chat import create_gradio_chat_interface
+from web.components.gradio_recorder_controls import create_recorder_controls
+from web.components.gradio_model_selector import create_model_selector
+from web.components.gradio_conversation_timeline import create_conversation_timeline_interface
 
 def create_ui():
     """Creates the Gradio UI."""
@@ -18,6 +19,9 @@ def create_ui():
     # We call it once, and the state is stored in a global-like singleton pattern.
     initialize_session_state()
 
+    # Load the embedding model in the background so the first search is fast
+    warm_up_embeddings()
+
     with gr.Blocks(title="Jarvis", theme=gr.themes.Soft()) as demo:
         with gr.Row():
             with gr.Column(scale=1):
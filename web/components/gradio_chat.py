@@ -1,16 +1,85 @@
 import gradio as gr
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import orjson
 import logging
 import re
-from web.web_utils.search_handler import search_conversations
+import pandas as pd
+from functools import lru_cache
+from web.web_utils.search_handler import stream_conversation_search
 from web.web_utils.session import session_state
+from web.web_utils.summary_table import summary_columns
 from utils.tool_manager import ToolManager
-from web.web_utils.llm_handler import get_llm_response
+from web.web_utils.llm_handler import get_llm_response, stream_llm_response
+from search.ollama_helper import OllamaStreamError
+from config import UI_STREAM_FLUSH_TOKENS, UI_CHAT_CONCURRENCY
 
 tool_manager = ToolManager()
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections to the MCP tool server, shared across chat turns
+_MCP_SESSION = requests.Session()
+_MCP_SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=0))
+
+SOURCE_COLUMNS = ["Date", "Relevance", "Summary"]
+
+# Pulls the JSON object out of the LLM's tool decision
+_JSON_OBJ_RE = re.compile(r'\{.*\}', re.DOTALL)
+# A real decision is a short object; don't scan runaway output past this
+_MAX_DECISION_CHARS = 8192
+
+# Chat text for each MCP tool's result; other tools are shown as raw JSON
+_TOOL_FORMATTERS = {
+    "get-forecast": lambda r: f"Weather in {r.get('location', 'N/A')}: {r.get('forecast', 'N/A')}",
+    "get-time": lambda r: f"Time in {r.get('location', 'N/A')}: {r.get('time', 'N/A')} on {r.get('date', 'N/A')}",
+    "web-search": lambda r: f"Web search results for '{r.get('query')}':\n" + "\n".join(f"- {item}" for item in r.get('results', [])),
+}
+
+class ToolDecisionError(Exception):
+    """Raised when the tool-routing LLM call fails, so failures aren't cached."""
+    pass
+
+@lru_cache(maxsize=512)
+def _cached_tool_decision(user_message, model):
+    """Ask the LLM which tool to use, once per (message, model)."""
+    tool_prompt = tool_manager.get_tool_prompt(user_message)
+    if not tool_prompt:
+        return None
+
+    llm_decision_str = get_llm_response(tool_prompt, model)
+    # get_llm_response reports connection failures as an "error" JSON object
+    if llm_decision_str.startswith('{"error"'):
+        raise ToolDecisionError(llm_decision_str)
+    return llm_decision_str
+
+def format_sources_df(raw_results):
+    """Builds a single table of search sources for display."""
+    if not raw_results:
+        return pd.DataFrame(columns=SOURCE_COLUMNS)
+
+    columns = summary_columns(r.get("metadata") for r in raw_results)
+    distance = pd.Series([r.get("distance") for r in raw_results], dtype="float64")
+    similarity = pd.Series([r.get("similarity", 0) for r in raw_results], dtype="float64")
+    relevance = (100 * (1 - distance)).fillna(100 * similarity)
+
+    return pd.DataFrame({
+        "Date": columns["Date"],
+        "Relevance": relevance.map("{:.1f}%".format),
+        "Summary": columns["Summary"]
+    })
+
+def flush_tokens(token_stream, chunks):
+    """
+    Appends streamed tokens to chunks, yielding the text so far every
+    UI_STREAM_FLUSH_TOKENS tokens rather than rebuilding it once per token.
+    The caller shows the final text once the stream ends.
+    """
+    for i, token in enumerate(token_stream, 1):
+        chunks.append(token)
+        if i % UI_STREAM_FLUSH_TOKENS == 0:
+            yield "".join(chunks)
+
 def create_gradio_chat_interface():
     with gr.Blocks() as chat_interface:
         with gr.Row():
@@ -26,6 +95,13 @@ def create_gradio_chat_interface():
             value=session_state.messages,
             type="messages"
         )
+        sources_table = gr.DataFrame(
+            headers=SOURCE_COLUMNS,
+            label="Sources",
+            interactive=False,
+            wrap=True,
+            visible=False
+        )
         msg = gr.Textbox(placeholder="Ask Jarvis a question...", label="Your Question")
         clear = gr.Button("Clear")
 
@@ -33,110 +109,154 @@ def create_gradio_chat_interface():
             history.append({"role": "user", "content": user_message})
             return "", history
 
+        def direct_llm_reply(history, user_message):
+            """Answers the message with a plain LLM call, without tools, streaming the reply."""
+            history.append({"role": "assistant", "content": ""})
+            yield history
+
+            chunks = []
+            try:
+                for text in flush_tokens(stream_llm_response(user_message, session_state.ollama_model), chunks):
+                    history[-1]["content"] = text
+                    yield history
+            except OllamaStreamError as e:
+                # Show the error after any partial reply
+                chunks.append(str(e))
+            history[-1]["content"] = "".join(chunks)
+            yield history
+
+        def chat_with_tools(history, user_message):
+            """Routes the message to an MCP tool, or falls back to a streamed LLM reply."""
+            # 1. Route to LLM to decide on tool usage (repeated messages reuse the decision)
+            try:
+                llm_decision_str = _cached_tool_decision(user_message, session_state.ollama_model)
+            except ToolDecisionError as e:
+                llm_decision_str = str(e)
+
+            if llm_decision_str is None:
+                logger.warning("Could not generate tool prompt. Falling back to direct LLM call.")
+                # Fallback to direct LLM if no tools are found
+                yield from direct_llm_reply(history, user_message)
+                return
+
+            try:
+                logger.info(f"LLM raw tool decision response: '{llm_decision_str}'")
+
+                # Clean the response to ensure it's valid JSON
+                json_match = _JSON_OBJ_RE.search(llm_decision_str, 0, _MAX_DECISION_CHARS)
+                if not json_match:
+                    # No object to parse, so skip straight to the fallback
+                    logger.info("No JSON object in tool decision, falling back to direct LLM call.")
+                    yield from direct_llm_reply(history, user_message)
+                    return
+                llm_decision_str = json_match.group(0)
+
+                llm_decision = orjson.loads(llm_decision_str)
+                logger.info(f"LLM parsed tool decision: {llm_decision}")
+
+                tool_name = llm_decision.get("tool")
+                confidence = llm_decision.get("confidence", 0)
+
+                # Extract all other potential parameters
+                params = {k: v for k, v in llm_decision.items() if k not in ["tool", "confidence"]}
+
+                # 2. If a tool is chosen with high confidence, execute it
+                if tool_name and confidence >= 0.8:
+                    logger.info(f"LLM decided to use tool '{tool_name}' with confidence {confidence}")
+                    try:
+                        mcp_response = _MCP_SESSION.post(
+                            f"http://localhost:5000/tool/{tool_name}",
+                            json=params,
+                            timeout=(1.0, 10.0)  # (connect, read): fail fast if the server is down
+                        )
+                        mcp_response.raise_for_status()
+                        tool_result = orjson.loads(mcp_response.content)
+
+                        if "error" in tool_result:
+                            response = f"Tool '{tool_name}' returned an error: {tool_result['error']}"
+                        else:
+                            formatter = _TOOL_FORMATTERS.get(tool_name)
+                            response = formatter(tool_result) if formatter else orjson.dumps(tool_result, option=orjson.OPT_INDENT_2).decode()
+
+                        history.append({"role": "assistant", "content": response})
+                        yield history
+
+                    except orjson.JSONDecodeError as e:
+                        logger.error(f"MCP server returned invalid JSON: {e}")
+                        response = f"Error: Tool '{tool_name}' returned an invalid response."
+                        history.append({"role": "assistant", "content": response})
+                        yield history
+
+                    except requests.exceptions.RequestException as e:
+                        logger.error(f"MCP server request failed: {e}")
+                        response = f"Error: Could not connect to the tool server. Is it running?"
+                        history.append({"role": "assistant", "content": response})
+                        yield history
+                else:
+                    # 3. If no tool is chosen, fall back to a direct LLM call
+                    logger.info("No tool selected, falling back to direct LLM call.")
+                    yield from direct_llm_reply(history, user_message)
+
+            except (json.JSONDecodeError, TypeError) as e:  # orjson.JSONDecodeError is a json.JSONDecodeError
+                logger.error(f"Failed to parse LLM tool decision. Raw response was: '{llm_decision_str}'", exc_info=True)
+                # Fallback to direct LLM if parsing fails
+                yield from direct_llm_reply(history, user_message)
+
+        def search_transcripts(history, user_message):
+            """Answers from past conversations, streaming the answer and then each source."""
+            model = session_state.ollama_model
+            search_result, token_stream = stream_conversation_search(user_message, top_k=5, model=model, prefetch=True)
+
+            if token_stream is not None:
+                # Show the sources table right away; it is sent once and the
+                # chat message keeps the detailed view
+                sources_df = format_sources_df(search_result["raw_results"])
+                history.append({"role": "assistant", "content": ""})
+                yield history, gr.update(value=sources_df, visible=True)
+
+                # Collect tokens and refresh the message every few tokens
+                # rather than rebuilding and sending it once per token
+                chunks = []
+                if search_result.get("cached"):
+                    chunks.append("_Answer reused from an earlier, similar question._\n\n")
+                for text in flush_tokens(token_stream, chunks):
+                    history[-1]["content"] = text
+                    yield history, gr.update()
+
+                chunks.append("\n\n**Sources:**")
+                # Reuse the table's columns instead of re-deriving them per result
+                for source in sources_df.itertuples(index=False):
+                    chunks.append(f"\n**Result (Relevance: {source.Relevance})**\n{source.Summary}\n---")
+                history[-1]["content"] = "".join(chunks)
+                yield history, gr.update()
+            else:
+                response = "I couldn't find any relevant information in your conversations."
+                history.append({"role": "assistant", "content": response})
+                yield history, gr.update(visible=False)
+
         def bot(history, mode):
             user_message = history[-1]["content"]
-            
+
             if mode == "Chat with Tools":
-                # 1. Route to LLM to decide on tool usage
-                tool_prompt = tool_manager.get_tool_prompt(user_message)
-                if not tool_prompt:
-                    logger.warning("Could not generate tool prompt. Falling back to direct LLM call.")
-                    # Fallback to direct LLM if no tools are found
-                    response = get_llm_response(user_message, session_state.ollama_model)
-                    history.append({"role": "assistant", "content": response})
-                    return history
-
-                try:
-                    llm_decision_str = get_llm_response(tool_prompt, session_state.ollama_model)
-                    logger.info(f"LLM raw tool decision response: '{llm_decision_str}'")
-                    
-                    # Clean the response to ensure it's valid JSON
-                    json_match = re.search(r'\{.*\}', llm_decision_str, re.DOTALL)
-                    if json_match:
-                        llm_decision_str = json_match.group(0)
-                    
-                    llm_decision = json.loads(llm_decision_str)
-                    logger.info(f"LLM parsed tool decision: {llm_decision}")
-                    
-                    tool_name = llm_decision.get("tool")
-                    confidence = llm_decision.get("confidence", 0)
-                    
-                    # Extract all other potential parameters
-                    params = {k: v for k, v in llm_decision.items() if k not in ["tool", "confidence"]}
-
-                    # 2. If a tool is chosen with high confidence, execute it
-                    if tool_name and confidence >= 0.8:
-                        logger.info(f"LLM decided to use tool '{tool_name}' with confidence {confidence}")
-                        try:
-                            mcp_response = requests.post(
-                                f"http://localhost:5000/tool/{tool_name}",
-                                json=params,
-                                timeout=10
-                            )
-                            mcp_response.raise_for_status()
-                            tool_result = mcp_response.json()
-                            
-                            if "error" in tool_result:
-                                response = f"Tool '{tool_name}' returned an error: {tool_result['error']}"
-                            elif tool_name == "get-forecast":
-                                response = f"Weather in {tool_result.get('location', 'N/A')}: {tool_result.get('forecast', 'N/A')}"
-                            elif tool_name == "get-time":
-                                response = f"Time in {tool_result.get('location', 'N/A')}: {tool_result.get('time', 'N/A')} on {tool_result.get('date', 'N/A')}"
-                            elif tool_name == "web-search":
-                                results_str = "\n".join([f"- {r}" for r in tool_result.get('results', [])])
-                                response = f"Web search results for '{tool_result.get('query')}':\n{results_str}"
-                            else:
-                                response = json.dumps(tool_result, indent=2)
-
-                            history.append({"role": "assistant", "content": response})
-                            return history
-
-                        except requests.exceptions.RequestException as e:
-                            logger.error(f"MCP server request failed: {e}")
-                            response = f"Error: Could not connect to the tool server. Is it running?"
-                            history.append({"role": "assistant", "content": response})
-                            return history
-                    else:
-                        # 3. If no tool is chosen, fall back to a direct LLM call
-                        logger.info("No tool selected, falling back to direct LLM call.")
-                        response = get_llm_response(user_message, session_state.ollama_model)
-                        history.append({"role": "assistant", "content": response})
-                        return history
-
-                except (json.JSONDecodeError, TypeError) as e:
-                    logger.error(f"Failed to parse LLM tool decision. Raw response was: '{llm_decision_str}'", exc_info=True)
-                    # Fallback to direct LLM if parsing fails
-                    response = get_llm_response(user_message, session_state.ollama_model)
-                    history.append({"role": "assistant", "content": response})
-                    return history
-            
+                for updated_history in chat_with_tools(history, user_message):
+                    yield updated_history, gr.update(visible=False)
             elif mode == "Search Transcripts":
                 # This is the existing RAG functionality
-                model = session_state.ollama_model
-                search_result = search_conversations(user_message, top_k=5, model=model)
-                
-                if search_result and "rag_response" in search_result:
-                    response = search_result["rag_response"]
-                    sources = []
-                    for result in search_result["raw_results"]:
-                        relevance = 100 * (1 - result["distance"]) if "distance" in result else 100 * result.get("similarity", 0)
-                        sources.append(f"**Result (Relevance: {relevance:.1f}%)**\n{result['metadata']['summary']}\n---")
-                    response_with_sources = f"{response}\n\n**Sources:**\n" + "\n".join(sources)
-                    history.append({"role": "assistant", "content": response_with_sources})
-                else:
-                    response = "I couldn't find any relevant information in your conversations."
-                    history.append({"role": "assistant", "content": response})
-
-            return history
+                yield from search_transcripts(history, user_message)
+            else:
+                yield history, gr.update()
 
         msg.submit(user, [msg, chatbot], [msg, chatbot], queue=False).then(
-            bot, [chatbot, mode_selector], chatbot
+            bot, [chatbot, mode_selector], [chatbot, sources_table],
+            # Gradio runs one event at a time by default; let concurrent chats overlap
+            concurrency_limit=UI_CHAT_CONCURRENCY
         )
         
         def clear_chat():
             session_state.messages = []
-            return []
+            _cached_tool_decision.cache_clear()
+            return [], gr.update(value=None, visible=False)
 
-        clear.click(clear_chat, None, chatbot, queue=False)
+        clear.click(clear_chat, None, [chatbot, sources_table], queue=False)
 
     return chat_interface 
\ No newline at end of file
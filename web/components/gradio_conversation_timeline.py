@@ -1,48 +1,66 @@
 import gradio as gr
 import logging
+from collections import Counter
+from functools import lru_cache
 import pandas as pd
-import plotly.graph_objects as go
 from web.web_utils.search_handler import get_all_conversations, delete_conversation
+from web.web_utils.summary_table import summary_columns
 
 logger = logging.getLogger(__name__)
 
 def create_timeline_plot(conversations):
     """Creates a Plotly timeline graph."""
     if not conversations:
-        return go.Figure().update_layout(title="No conversation data available", template="plotly_dark")
+        import plotly.graph_objects as go
+        return go.Figure(layout=go.Layout(title="No conversation data available", template="plotly_dark"))
         
-    df = pd.DataFrame([conv['metadata'] for conv in conversations])
-    df['date'] = pd.to_datetime(df['timestamp']).dt.date
-    daily_counts = df.groupby('date').size().reset_index(name='counts')
+    # Count per ISO date prefix; no need to build a frame of every summary
+    daily_counts = Counter(
+        conv['metadata']['timestamp'][:10]
+        for conv in conversations
+        if conv['metadata'].get('timestamp')
+    )
+    # The sorted (date, count) pairs fingerprint the data, so an unchanged
+    # history reuses the figure built last time
+    return _build_timeline_figure(tuple(sorted(daily_counts.items())))
+
+@lru_cache(maxsize=8)
+def _build_timeline_figure(daily_counts):
+    """Builds the volume bar chart from sorted (date, count) pairs."""
+    # Plotly is only loaded once the timeline is first drawn
+    import plotly.graph_objects as go
 
-    fig = go.Figure(data=[go.Bar(x=daily_counts['date'], y=daily_counts['counts'])])
-    fig.update_layout(
-        title="Conversation Volume",
-        xaxis_title="Date",
-        yaxis_title="Number of Conversations",
-        template="plotly_dark",
-        height=300
+    dates = [date for date, _ in daily_counts]
+    counts = [count for _, count in daily_counts]
+
+    # Pass the layout to the constructor rather than updating it afterwards
+    return go.Figure(
+        data=[go.Bar(x=dates, y=counts)],
+        layout=go.Layout(
+            title="Conversation Volume",
+            xaxis_title="Date",
+            yaxis_title="Number of Conversations",
+            template="plotly_dark",
+            height=300
+        )
     )
-    return fig
 
 def format_conversations_to_df(conversations):
     """Formats a list of conversation dicts into a Pandas DataFrame."""
     if not conversations:
         return pd.DataFrame(columns=["ID", "Date", "Summary"])
     
-    data = []
-    for conv in conversations:
-        data.append({
-            "ID": conv['id'],
-            "Date": conv['metadata'].get('timestamp', 'N/A').split("T")[0],
-            "Summary": conv['metadata'].get('summary', 'No summary available.')
-        })
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        "ID": [conv['id'] for conv in conversations],
+        **summary_columns(conv['metadata'] for conv in conversations)
+    })
 
 def create_conversation_timeline_interface():
     """Creates the Gradio interface for the Conversation Timeline."""
     with gr.Blocks(analytics_enabled=False) as timeline_interface:
         selected_conversation_id = gr.State(None)
+        # (id, summary) per table row, so a selection doesn't send the table back
+        conversation_rows = gr.State([])
 
         with gr.Row():
             refresh_button = gr.Button("Refresh")
@@ -72,19 +90,18 @@ def create_conversation_timeline_interface():
             return {
                 timeline_plot: plot,
                 conversation_df: gr.update(value=df, interactive=True),
+                conversation_rows: list(zip(df["ID"], df["Summary"])),
                 delete_button: gr.update(visible=False),
                 selected_conversation_id: None,
                 selected_summary_display: gr.update(visible=False, value="")
             }
 
-        def handle_select_conversation(evt: gr.SelectData, df: pd.DataFrame):
+        def handle_select_conversation(evt: gr.SelectData, rows):
             """Handles the selection of a conversation in the DataFrame."""
-            if evt.index is None:
+            if evt.index is None or evt.index[0] >= len(rows):
                 return gr.update(visible=False), None, gr.update(visible=False)
             
-            selected_row = df.iloc[evt.index[0]]
-            conv_id = selected_row["ID"]
-            summary_text = selected_row["Summary"]
+            conv_id, summary_text = rows[evt.index[0]]
             
             logger.info(f"Conversation selected: {conv_id}")
             return {
@@ -106,23 +123,23 @@ def create_conversation_timeline_interface():
 
         # Wire up event handlers
         refresh_button.click(refresh_timeline, outputs=[
-            timeline_plot, conversation_df, delete_button, selected_conversation_id, selected_summary_display
+            timeline_plot, conversation_df, conversation_rows, delete_button, selected_conversation_id, selected_summary_display
         ])
         
         conversation_df.select(
             handle_select_conversation, 
-            inputs=[conversation_df], 
+            inputs=[conversation_rows],
             outputs=[delete_button, selected_conversation_id, selected_summary_display]
         )
         
         delete_button.click(
             handle_delete_conversation,
             inputs=[selected_conversation_id],
-            outputs=[timeline_plot, conversation_df, delete_button, selected_conversation_id, selected_summary_display]
+            outputs=[timeline_plot, conversation_df, conversation_rows, delete_button, selected_conversation_id, selected_summary_display]
         )
         
         timeline_interface.load(refresh_timeline, outputs=[
-            timeline_plot, conversation_df, delete_button, selected_conversation_id, selected_summary_display
+            timeline_plot, conversation_df, conversation_rows, delete_button, selected_conversation_id, selected_summary_display
         ])
 
     return timeline_interface 
\ No newline at end of file
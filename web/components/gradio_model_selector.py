@@ -21,12 +21,19 @@ def create_model_selector():
             value=session_state.ollama_model,
             interactive=True
         )
+        refresh_button = gr.Button("⟳", scale=0, min_width=40)
 
     def on_model_change(selected_model):
         session_state.ollama_model = selected_model
         logger.info(f"Ollama model changed to: {selected_model}")
-        return selected_model
 
-    model_selector.change(on_model_change, inputs=model_selector, outputs=model_selector)
+    # No outputs: echoing the value back would re-render the dropdown for nothing
+    model_selector.change(on_model_change, inputs=model_selector)
+
+    def refresh_models():
+        # Bypass the cached list, e.g. after pulling a new model
+        return gr.update(choices=get_available_models(refresh=True))
+
+    refresh_button.click(refresh_models, outputs=model_selector, queue=False)
 
     return model_selector 
\ No newline at end of file
@@ -1,5 +1,7 @@
 import gradio as gr
 import time
+from collections import deque
+from itertools import islice
 from utils.recorder import start_transcription, pause_transcription, resume_transcription, stop_transcription
 from web.web_utils.session import session_state
 from setup.logger import logger
@@ -10,19 +12,18 @@ def add_to_console(message, error=False):
     formatted_message = f"[{timestamp}] {'❗ ' if error else ''}{message}"
     
     if session_state.console_output is None:
-        session_state.console_output = []
+        session_state.console_output = deque(maxlen=100)
         
+    # Bounded deque: the oldest line drops off without copying the history
     session_state.console_output.append(formatted_message)
-    # Limit console history
-    if len(session_state.console_output) > 100:
-        session_state.console_output = session_state.console_output[-100:]
     
     if error:
         logger.error(message)
     else:
         logger.info(message)
 
-    return "\n".join(session_state.console_output[-15:])
+    console_output = session_state.console_output
+    return "\n".join(islice(console_output, max(len(console_output) - 15, 0), None))
 
 def create_recorder_controls():
     """Create the Gradio recorder controls interface."""
@@ -40,63 +41,64 @@ def create_recorder_controls():
             gr.Markdown("### 📟 Console Output")
             console_output = gr.Textbox(label="Console", lines=10, interactive=False, autoscroll=True)
 
+            def recorder_update(start=None, pause=None, stop=None, status=None, console=None):
+                """
+                Builds an update for only the widgets that change.
+                start/pause/stop take gr.update() keyword dicts, status and
+                console take the new text; None leaves a widget as it is.
+                """
+                updates = {}
+                for button, changes in ((start_button, start), (pause_button, pause), (stop_button, stop)):
+                    if changes is not None:
+                        updates[button] = gr.update(**changes)
+                if status is not None:
+                    updates[status_text] = gr.update(value=status)
+                if console is not None:
+                    updates[console_output] = gr.update(value=console)
+                return updates
+
+            def recording_update(console_str):
+                return recorder_update(
+                    start={"interactive": False},
+                    pause={"interactive": True},
+                    stop={"interactive": True},
+                    status="▶️ Recording",
+                    console=console_str
+                )
+
             def start_or_resume_recording_ui():
                 if session_state.is_recording and session_state.is_paused:
-                    console_str = add_to_console("Resuming transcription...")
+                    add_to_console("Resuming transcription...")
                     success = resume_transcription()
                     if success:
                         session_state.is_paused = False
-                        console_str = add_to_console("▶️ Recording resumed")
-                        return {
-                            start_button: gr.update(interactive=False),
-                            pause_button: gr.update(interactive=True),
-                            stop_button: gr.update(interactive=True),
-                            status_text: gr.update(value="▶️ Recording"),
-                            console_output: gr.update(value=console_str)
-                        }
+                        return recording_update(add_to_console("▶️ Recording resumed"))
                     else:
-                        console_str = add_to_console("❌ Failed to resume recording", error=True)
-                        return {
-                            console_output: gr.update(value=console_str)
-                        }
+                        return recorder_update(console=add_to_console("❌ Failed to resume recording", error=True))
                 else:
-                    console_str = add_to_console("Starting transcription...")
+                    add_to_console("Starting transcription...")
                     success = start_transcription()
                     if success:
                         session_state.is_recording = True
                         session_state.is_paused = False
-                        console_str = add_to_console("✅ Recording started successfully!")
-                        return {
-                            start_button: gr.update(interactive=False),
-                            pause_button: gr.update(interactive=True),
-                            stop_button: gr.update(interactive=True),
-                            status_text: gr.update(value="▶️ Recording"),
-                            console_output: gr.update(value=console_str)
-                        }
+                        return recording_update(add_to_console("✅ Recording started successfully!"))
                     else:
-                        console_str = add_to_console("❌ Failed to start recording", error=True)
-                        return {
-                            console_output: gr.update(value=console_str)
-                        }
+                        return recorder_update(console=add_to_console("❌ Failed to start recording", error=True))
 
             def pause_recording_ui():
-                console_str = add_to_console("Pausing transcription...")
+                add_to_console("Pausing transcription...")
                 success = pause_transcription()
                 if success:
                     session_state.is_paused = True
-                    console_str = add_to_console("⏸️ Recording paused")
-                    return {
-                        start_button: gr.update(value="▶️ Resume", interactive=True),
-                        pause_button: gr.update(interactive=False),
-                        stop_button: gr.update(interactive=True),
-                        status_text: gr.update(value="⏸️ Paused"),
-                        console_output: gr.update(value=console_str)
-                    }
+                    return recorder_update(
+                        start={"value": "▶️ Resume", "interactive": True},
+                        pause={"interactive": False},
+                        stop={"interactive": True},
+                        status="⏸️ Paused",
+                        console=add_to_console("⏸️ Recording paused")
+                    )
                 else:
-                    console_str = add_to_console("❌ Failed to pause recording", error=True)
-                    return {
-                        console_output: gr.update(value=console_str)
-                    }
+                    return recorder_update(console=add_to_console("❌ Failed to pause recording", error=True))
 
             def stop_recording_ui():
                 console_str = add_to_console("Stopping transcription...")
@@ -108,13 +110,13 @@ def create_recorder_controls():
                 
                 session_state.is_recording = False
                 session_state.is_paused = False
-                return {
-                    start_button: gr.update(value="▶️ Start", interactive=True),
-                    pause_button: gr.update(interactive=False),
-                    stop_button: gr.update(interactive=False),
-                    status_text: gr.update(value="⏹️ Stopped"),
-                    console_output: gr.update(value=console_str)
-                }
+                return recorder_update(
+                    start={"value": "▶️ Start", "interactive": True},
+                    pause={"interactive": False},
+                    stop={"interactive": False},
+                    status="⏹️ Stopped",
+                    console=console_str
+                )
 
             start_button.click(
                 start_or_resume_recording_ui,
@@ -2,12 +2,23 @@
 Utilities for search functionality in the web interface
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from search.search_engine import normalize_search_results, unified_search
 from setup.logger import logger
 
+def _format_result(result):
+    """Flatten one raw search result into the fields the display needs."""
+    # Resolve metadata once instead of re-checking it for every field
+    metadata = result.get("metadata") or {}
+    timestamp = metadata.get("timestamp")
+    return {
+        "id": result.get("id", ""),
+        "title": result.get("title") or timestamp or "No Title",
+        "content": result.get("content") or metadata.get("summary", ""),
+        "similarity": result.get("similarity", 0),
+        "source": result.get("source", "unknown"),
+        "date": metadata.get("timestamp", "Unknown Date")
+    }
+
 def format_search_results_for_display(search_results):
     """
     Format search results for display in the web interface.
@@ -22,37 +33,7 @@ def format_search_results_for_display(search_results):
         if not search_results.get("success", False):
             return []
             
-        results = search_results.get("raw_results", [])
-        formatted = []
-        
-        for result in results:
-            # Ensure result has consistent structure
-            normalized = result.copy()
-            
-            # Get content from the right place
-            content = normalized.get("content", "")
-            if not content and "metadata" in normalized and normalized["metadata"] and "summary" in normalized["metadata"]:
-                content = normalized["metadata"]["summary"]
-                
-            # Get title from timestamp if available
-            title = normalized.get("title", "")
-            if not title and "metadata" in normalized and normalized["metadata"] and "timestamp" in normalized["metadata"]:
-                title = normalized["metadata"]["timestamp"]
-            elif not title:
-                title = "No Title"
-                
-            # Format the result
-            formatted_result = {
-                "id": normalized.get("id", ""),
-                "title": title,
-                "content": content,
-                "similarity": normalized.get("similarity", 0),
-                "source": normalized.get("source", "unknown"),
-                "date": normalized.get("metadata", {}).get("timestamp", "Unknown Date")
-            }
-            formatted.append(formatted_result)
-            
-        return formatted
+        return [_format_result(result) for result in search_results.get("raw_results", [])]
         
     except Exception as e:
         logger.error(f"Error formatting search results: {str(e)}")
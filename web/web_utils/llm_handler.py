@@ -1,48 +1,102 @@
 import requests
-import json
+import orjson
 import logging
+import time
+from contextlib import closing
+from search.ollama_helper import (
+    OLLAMA_SESSION, ollama_down, record_ollama_connection, stream_generate, OllamaStreamError
+)
+from config import OLLAMA_URL, UI_MODEL_LIST_TTL_SEC
 
 logger = logging.getLogger(__name__)
 
-def get_available_models():
-    """Gets a list of available models from the Ollama API."""
+# Last successful model list: {"time": monotonic seconds, "models": [...]}
+_models_cache = {"time": 0.0, "models": None}
+
+def get_available_models(refresh=False):
+    """
+    Gets a list of available models from the Ollama API.
+
+    The list is reused for UI_MODEL_LIST_TTL_SEC seconds; pass refresh=True
+    to query Ollama regardless.
+    """
+    if (not refresh and _models_cache["models"] is not None
+            and time.monotonic() - _models_cache["time"] < UI_MODEL_LIST_TTL_SEC):
+        return list(_models_cache["models"])
+    if ollama_down():
+        return []
+
     try:
-        response = requests.get("http://localhost:11434/api/tags")
+        response = OLLAMA_SESSION.get(OLLAMA_URL.replace("/api/generate", "/api/tags"), timeout=(3, 10))
+        record_ollama_connection(True)
         response.raise_for_status()
-        models = [model['name'] for model in response.json().get('models', [])]
-        return models
+        models = [model['name'] for model in orjson.loads(response.content).get('models', [])]
+        _models_cache.update(time=time.monotonic(), models=models)
+        return list(models)
     except requests.exceptions.RequestException as e:
+        if isinstance(e, requests.exceptions.ConnectionError):
+            record_ollama_connection(False)
         logger.error(f"Could not connect to Ollama to fetch models: {e}")
         return []
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.error("Failed to decode JSON from Ollama models response.")
         return []
 
+class _JsonObjectTracker:
+    """Follows streamed text and reports when the first top-level JSON object closes."""
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text):
+        """Returns True once the outermost '{' seen so far has been closed."""
+        for char in text:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"' and self.depth > 0:
+                self.in_string = True
+            elif char == "{":
+                self.depth += 1
+            elif char == "}" and self.depth > 0:
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
+
 def get_llm_response(prompt, model):
+    """
+    Gets a JSON answer from the LLM.
+
+    The response is streamed and the request is closed as soon as the first
+    JSON object is complete, so Ollama stops generating any trailing text.
+    Failures are reported as an "error" JSON object.
+    """
+    chunks = []
+    tracker = _JsonObjectTracker()
     try:
-        response = requests.post(
-            "http://localhost:11434/api/generate",
-            headers={"Content-Type": "application/json"},
-            data=json.dumps({
-                "model": model,
-                "prompt": prompt,
-                "stream": False,
-                "json": True,
-                "temperature": 0
-            })
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("response", "").strip()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error calling LLM: {e}")
-        return f'{{"error": "Could not connect to the LLM. Please ensure Ollama is running.", "details": "{e}"}}'
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to decode JSON from LLM response: {e}")
-        # The response may not be available if the request failed, so handle that case
-        try:
-            raw_response = response.text
-            logger.error(f"Raw LLM response: {raw_response}")
-            return raw_response
-        except NameError:
-            return '{"error": "Failed to get a response from the LLM."}' 
\ No newline at end of file
+        # Keep-alive holds the model, and the cached tool-prompt prefix, between turns
+        with closing(stream_generate({"model": model, "prompt": prompt, "json": True, "temperature": 0})) as stream:
+            for text in stream:
+                chunks.append(text)
+                if tracker.feed(text):
+                    break
+        return "".join(chunks).strip()
+    except OllamaStreamError as e:
+        # Hand back whatever text arrived before the failure
+        if chunks:
+            return "".join(chunks).strip()
+        return orjson.dumps({"error": str(e)}).decode()
+
+def stream_llm_response(prompt, model):
+    """
+    Streams the LLM response for a prompt, yielding text chunks as Ollama generates them.
+    Raises OllamaStreamError like stream_generate.
+    """
+    return stream_generate({"model": model, "prompt": prompt, "temperature": 0})
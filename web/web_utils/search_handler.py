@@ -16,37 +16,274 @@ from past conversations to the language model.
 """
 
 import logging
-from search.search_engine import unified_search
+import threading
+import time
+from functools import lru_cache
+from search.search_engine import unified_search, submit_keyword_search, extract_keywords
 from web.web_utils.session import session_state
-from search.ollama_helper import get_embedding
+from search.ollama_helper import get_embedding, get_model_digest, rag_search_stream, query_ollama, OllamaStreamError
 from storage.chroma_store import get_all_summaries as get_all_conversations
-from storage.chroma_store import delete_summary_by_id as delete_conversation
+from storage.chroma_store import delete_summaries_by_ids
+from storage import embedding_cache
+from web.web_utils.semantic_cache import SemanticCache
+from config import (
+    EMBEDDING_CACHE_DIGEST_TTL_SEC, SEARCH_SEMANTIC_CACHE_ENABLED, SEARCH_SEMANTIC_CACHE_SIZE, SEARCH_SEMANTIC_CACHE_THRESHOLD,
+    SEARCH_SEMANTIC_CACHE_TTL_SEC, SEARCH_PREFETCH_FOLLOW_UPS,
+    RAG_FOLLOW_UP_PROMPT
+)
 
 logger = logging.getLogger(__name__)
 
+# Background thread that warms the embedding model on startup
+_warmup_thread = None
+
+def warm_up_embeddings(model=None):
+    """
+    Load the embedding model in a background thread so the first real query
+    doesn't pay Ollama's cold-start cost on the UI thread.
+    """
+    global _warmup_thread
+
+    if _warmup_thread is not None:
+        return _warmup_thread
+
+    model_to_use = model if model else session_state.ollama_model
+    if not model_to_use:
+        logger.warning("No Ollama model available to warm up embeddings.")
+        return None
+
+    # Start the digest lookup too, so the first query can use the disk cache
+    _get_model_digest(model_to_use)
+
+    def run_warmup():
+        if get_embedding("warmup", model=model_to_use):
+            logger.info(f"Embedding model warmed up: {model_to_use}")
+        else:
+            logger.warning(f"Embedding warm-up failed for model: {model_to_use}")
+
+    _warmup_thread = threading.Thread(target=run_warmup)
+    _warmup_thread.daemon = True
+    _warmup_thread.start()
+    return _warmup_thread
+
+class EmbeddingError(Exception):
+    """Raised when Ollama returns no embedding, so failures aren't cached."""
+    pass
+
+# Recently checked model digests: model -> (monotonic fetch time, digest or None)
+_model_digests = {}
+# Models whose digest is being fetched in the background
+_digest_refreshing = set()
+_digest_lock = threading.Lock()
+
+def _refresh_model_digest(model):
+    """Fetch a model's digest from Ollama and remember it."""
+    try:
+        digest = get_model_digest(model)
+        with _digest_lock:
+            _model_digests[model] = (time.monotonic(), digest)
+    finally:
+        with _digest_lock:
+            _digest_refreshing.discard(model)
+
+def _get_model_digest(model):
+    """
+    Get the last known digest of a model's weights without waiting on Ollama.
+
+    Digests older than EMBEDDING_CACHE_DIGEST_TTL_SEC are re-checked in a
+    background thread. Until the first check finishes this returns None,
+    and queries skip the disk cache.
+    """
+    with _digest_lock:
+        cached = _model_digests.get(model)
+        stale = cached is None or time.monotonic() - cached[0] >= EMBEDDING_CACHE_DIGEST_TTL_SEC
+        if stale and model not in _digest_refreshing:
+            _digest_refreshing.add(model)
+            refresh_thread = threading.Thread(target=_refresh_model_digest, args=(model,))
+            refresh_thread.daemon = True
+            refresh_thread.start()
+    return cached[1] if cached else None
+
+@lru_cache(maxsize=1024)
+def _cached_embedding(text, model, digest):
+    """Embed a query once per (text, model, digest); returns a hashable tuple."""
+    # Queries from earlier sessions are kept on disk, tied to the exact weights
+    if digest:
+        embedding = embedding_cache.get_embedding(model, digest, text)
+        if embedding:
+            return tuple(embedding)
+
+    embedding = get_embedding(text, model=model)
+    if not embedding:
+        raise EmbeddingError(f"No embedding returned for query: {text}")
+    if digest:
+        embedding_cache.put_embedding(model, digest, text, embedding)
+    return tuple(embedding)
+
+def get_query_embedding(query, model):
+    """Get the embedding for a search query, reusing earlier results."""
+    try:
+        # A re-pulled model gets a new digest, so older vectors stop matching
+        return list(_cached_embedding(query.strip(), model, _get_model_digest(model)))
+    except EmbeddingError as e:
+        logger.warning(str(e))
+        return []
+
+# Semantic caches of search results, one per (model, top_k)
+_search_caches = {}
+_search_caches_lock = threading.Lock()
+
+def _get_search_cache(model, top_k):
+    """Get the semantic cache for a model and result count, creating it if needed."""
+    with _search_caches_lock:
+        key = (model, top_k)
+        if key not in _search_caches:
+            _search_caches[key] = SemanticCache(
+                max_entries=SEARCH_SEMANTIC_CACHE_SIZE,
+                threshold=SEARCH_SEMANTIC_CACHE_THRESHOLD,
+                ttl_seconds=SEARCH_SEMANTIC_CACHE_TTL_SEC
+            )
+        return _search_caches[key]
+
+def clear_search_caches():
+    """Drop all cached search results, e.g. after the stored conversations change."""
+    with _search_caches_lock:
+        for cache in _search_caches.values():
+            cache.clear()
+
+def delete_conversation(conv_id):
+    """Delete a conversation and forget any search results that may include it."""
+    return delete_conversations([conv_id])
+
+def delete_conversations(conv_ids):
+    """Delete several conversations at once, clearing the search caches a single time."""
+    success = delete_summaries_by_ids(conv_ids)
+    clear_search_caches()
+    return success
+
 def search_conversations(query, top_k=5, model=None):
     """
     Performs a unified search for conversations, using embeddings and optional RAG.
     """
+    # Same pipeline as the streaming search; just wait for the full answer
+    search_result, token_stream = stream_conversation_search(query, top_k, model)
+    if token_stream is not None:
+        for _ in token_stream:
+            pass
+    return search_result
+
+def stream_conversation_search(query, top_k=5, model=None, prefetch=False):
+    """
+    Performs a unified search for conversations and streams the RAG answer.
+    With prefetch=True, likely follow-up queries are searched in the
+    background once a fresh answer has streamed successfully.
+
+    Returns:
+        (search_result, token_stream). search_result holds raw_results right
+        away; its rag_response is filled in once token_stream is exhausted.
+        search_result["cached"] is True when an earlier answer was reused.
+        token_stream is None when the search itself failed.
+    """
     if not query:
-        return None
-    
+        return None, None
+
     model_to_use = model if model else session_state.ollama_model
     if not model_to_use:
         logger.warning("No Ollama model specified or found in session state for search.")
-        return {"success": False, "message": "No model selected"}
-        
-    embedding = get_embedding(query, model=model_to_use)
+        return {"success": False, "message": "No model selected"}, None
+
+    # The keyword scan doesn't need the embedding, so run it while Ollama embeds
+    keyword_future = submit_keyword_search(query)
+
+    embedding = get_query_embedding(query, model_to_use)
     if not embedding:
-        return {"success": False, "message": "Failed to get embedding for query"}
+        keyword_future.cancel()
+        return {"success": False, "message": "Failed to get embedding for query"}, None
+
+    search_cache = _get_search_cache(model_to_use, top_k)
+    # Close embeddings can still differ in a name or a day, so an answer is
+    # only reused for a query with exactly the same keywords
+    keywords = frozenset(extract_keywords(query))
+    cached = search_cache.get(embedding) if SEARCH_SEMANTIC_CACHE_ENABLED else None
+    if cached is not None and cached[0] == keywords:
+        logger.info(f"Semantic cache hit for query: '{query}'")
+        keyword_future.cancel()
+        cached_result = {**cached[1], "cached": True}
+        return cached_result, iter([cached_result["rag_response"]])
 
     try:
-        result = unified_search(query, embedding, top_k, use_rag=True, model=model_to_use)
-        return result
+        result = unified_search(query, embedding, top_k, use_rag=False, model=model_to_use,
+                                keyword_future=keyword_future)
     except Exception as e:
         logger.error(f"Error during RAG search: {e}")
+        return None, None
+
+    if not result.get("success"):
+        return result, None
+
+    def token_stream():
+        chunks = []
+        try:
+            for chunk in rag_search_stream(query, result["raw_results"], model=model_to_use):
+                chunks.append(chunk)
+                yield chunk
+        except OllamaStreamError as e:
+            # Show the error after any partial answer, but never cache it
+            chunks.append(str(e))
+            yield str(e)
+            result["rag_response"] = "".join(chunks)
+            return
+        result["rag_response"] = "".join(chunks)
+        if SEARCH_SEMANTIC_CACHE_ENABLED:
+            search_cache.put(embedding, (keywords, result))
+        if prefetch:
+            # Warm the cache for the questions the user is likely to ask next
+            prefetch_follow_ups(query, result["rag_response"], top_k=top_k, model=model_to_use)
+
+    return result, token_stream()
+
+# Background thread that prefetches predicted follow-up queries
+_prefetch_thread = None
+_prefetch_lock = threading.Lock()
+
+def prefetch_follow_ups(query, answer, top_k=5, model=None):
+    """
+    Predict likely follow-up questions and run them in the background so
+    their results are already in the semantic cache when the user asks.
+    """
+    global _prefetch_thread
+
+    # Prefetched results are only ever read back through the semantic cache
+    if SEARCH_PREFETCH_FOLLOW_UPS <= 0 or not SEARCH_SEMANTIC_CACHE_ENABLED or not answer:
         return None
 
-# By importing and aliasing from chroma_store, we no longer need the incorrect,
-# locally defined get_all_conversations and delete_conversation functions.
-# The timeline component will now call the correct backend functions directly. 
\ No newline at end of file
+    model_to_use = model if model else session_state.ollama_model
+    if not model_to_use:
+        return None
+
+    def run_prefetch():
+        prompt = RAG_FOLLOW_UP_PROMPT.format(query=query, answer=answer, count=SEARCH_PREFETCH_FOLLOW_UPS)
+        predicted = query_ollama("", prompt, model=model_to_use)
+        if predicted.startswith("Error"):
+            logger.warning(f"Could not predict follow-up queries: {predicted}")
+            return
+
+        follow_ups = [line.strip(" -*\t") for line in predicted.splitlines() if line.strip(" -*\t")]
+        for follow_up in follow_ups[:SEARCH_PREFETCH_FOLLOW_UPS]:
+            logger.info(f"Prefetching follow-up query: '{follow_up}'")
+            search_conversations(follow_up, top_k=top_k, model=model_to_use)
+
+    # Only one prefetch at a time so Ollama isn't flooded with background work;
+    # the lock stops concurrent chat turns from each starting one
+    with _prefetch_lock:
+        if _prefetch_thread is not None and _prefetch_thread.is_alive():
+            logger.debug("Follow-up prefetch already running, skipping")
+            return None
+
+        _prefetch_thread = threading.Thread(target=run_prefetch)
+        _prefetch_thread.daemon = True
+        _prefetch_thread.start()
+        return _prefetch_thread
+
+# get_all_conversations is aliased straight from chroma_store; delete_conversation
+# wraps it so the search caches don't keep serving deleted conversations. 
\ No newline at end of file
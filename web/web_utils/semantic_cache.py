@@ -0,0 +1,109 @@
+"""
+Semantic Cache Module
+
+This module provides an in-process cache keyed on embedding similarity rather
+than exact text, so paraphrased queries can reuse earlier results.
+
+Role in the system:
+- Stores (embedding, value) pairs in a pre-normalized NumPy matrix
+- Finds the closest cached entry with a single vectorized cosine similarity
+- Returns cached values only above a configurable similarity threshold
+- Evicts the least recently used entry when full and expires stale entries
+
+Used by the search handler to skip Chroma and the RAG LLM call for queries
+that are near-duplicates of recent ones.
+"""
+
+import threading
+import time
+import numpy as np
+
+class SemanticCache:
+    """Least-recently-used cache looked up by cosine similarity of embeddings."""
+
+    def __init__(self, max_entries=256, threshold=0.95, ttl_seconds=None):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._embeddings = None  # (max_entries, dim) float32, rows are unit vectors
+        self._values = [None] * max_entries
+        self._last_used = np.zeros(max_entries, dtype=np.float64)
+        self._created = np.zeros(max_entries, dtype=np.float64)
+        self._size = 0
+
+    @staticmethod
+    def _normalize(embedding):
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else None
+
+    def _live_mask(self, now):
+        """Rows that are filled and not expired."""
+        mask = np.zeros(self.max_entries, dtype=bool)
+        mask[:self._size] = True
+        if self.ttl_seconds is not None:
+            mask &= (now - self._created) < self.ttl_seconds
+        return mask
+
+    def get(self, embedding):
+        """
+        Look up the value cached for the most similar embedding.
+
+        Args:
+            embedding: Query embedding
+
+        Returns:
+            The cached value, or None if nothing is similar enough.
+        """
+        query = self._normalize(embedding)
+        if query is None:
+            return None
+
+        with self._lock:
+            if self._size == 0 or query.shape[0] != self._embeddings.shape[1]:
+                return None
+
+            now = time.monotonic()
+            similarities = self._embeddings[:self._size] @ query
+            similarities[~self._live_mask(now)[:self._size]] = -np.inf
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+
+            self._last_used[best] = now
+            return self._values[best]
+
+    def put(self, embedding, value):
+        """Cache a value under an embedding, evicting the LRU entry if full."""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        with self._lock:
+            if self._embeddings is None or vector.shape[0] != self._embeddings.shape[1]:
+                # First entry (or a model with a new dimension): start fresh
+                self._embeddings = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+                self._values = [None] * self.max_entries
+                self._size = 0
+
+            now = time.monotonic()
+            if self._size < self.max_entries:
+                row = self._size
+                self._size += 1
+            else:
+                # Expired rows sort first, then the least recently used
+                recency = np.where(self._live_mask(now), self._last_used, -np.inf)
+                row = int(np.argmin(recency))
+
+            self._embeddings[row] = vector
+            self._values[row] = value
+            self._last_used[row] = now
+            self._created[row] = now
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._embeddings = None
+            self._values = [None] * self.max_entries
+            self._size = 0
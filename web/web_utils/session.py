@@ -15,57 +15,46 @@ Used by the main web UI during initialization and by components that need
 access to persistent state variables.
 """
 
-class SessionState:
-    def __init__(self):
-        self._state = {}
+from collections import deque
+from config import UI_DEFAULT_MODEL
 
-    def __getattr__(self, name):
-        return self._state.get(name)
+class SessionState:
+    # Fixed set of state variables, stored as slots so reads are plain attribute loads
+    __slots__ = (
+        "messages", "search_results", "selected_topic",
+        "is_recording", "is_paused", "recorder_process", "console_output",
+        "ollama_model", "chat_messages", "topic_results"
+    )
 
-    def __setattr__(self, name, value):
-        if name == "_state":
-            super().__setattr__(name, value)
-        else:
-            self._state[name] = value
+    def __init__(self):
+        # Every variable starts unset (None) until initialize_session_state runs
+        for name in self.__slots__:
+            setattr(self, name, None)
 
 # Global session state
 session_state = SessionState()
 
-def initialize_session_state():
-    """Initialize session state variables."""
-    if session_state.messages is None:
-        session_state.messages = []
-        
-    if session_state.search_results is None:
-        session_state.search_results = []
-        
-    if session_state.selected_topic is None:
-        session_state.selected_topic = None
-        
+# Starting value for each state variable; callables build a fresh object per session
+_DEFAULTS = {
+    "messages": list,
+    "search_results": list,
     # Recording state
-    if session_state.is_recording is None:
-        session_state.is_recording = False
-    
-    if session_state.is_paused is None:
-        session_state.is_paused = False
-        
-    if session_state.recorder_process is None:
-        session_state.recorder_process = None
-        
-    if session_state.console_output is None:
-        session_state.console_output = []
-        
+    "is_recording": False,
+    "is_paused": False,
+    # Bounded so the recorder console keeps only the latest 100 lines
+    "console_output": lambda: deque(maxlen=100),
     # Model selection
-    if session_state.ollama_model is None:
-        from config import UI_DEFAULT_MODEL
-        session_state.ollama_model = UI_DEFAULT_MODEL
+    "ollama_model": UI_DEFAULT_MODEL,
+    # Tab-specific state
+    "chat_messages": list,
+    "topic_results": list,
+}
 
-    # Add any tab-specific initialization if needed
-    if session_state.chat_messages is None:
-        session_state.chat_messages = []
-        
-    if session_state.topic_results is None:
-        session_state.topic_results = []
+def initialize_session_state():
+    """Initialize session state variables that are still unset."""
+    for name, default in _DEFAULTS.items():
+        if getattr(session_state, name) is None:
+            setattr(session_state, name, default() if callable(default) else default)
 
 def get_recording_state():
     """Get the current recording state."""
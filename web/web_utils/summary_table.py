@@ -0,0 +1,30 @@
+"""
+Summary Table Helpers
+
+Shared column builders for the tables that list conversation summaries.
+
+Role in the system:
+- Turns summary metadata into the Date and Summary display columns
+- Keeps the placeholders for missing fields the same in every table
+
+Used by the chat sources table and the conversation timeline table.
+"""
+
+import pandas as pd
+
+def summary_columns(metadatas):
+    """
+    Builds the Date and Summary columns from summary metadata dicts.
+
+    Args:
+        metadatas: iterable of metadata dicts (None is treated as empty)
+
+    Returns:
+        dict: {"Date": Series, "Summary": Series}, ready to pass to a DataFrame
+    """
+    # Build whole columns at once instead of a dict per row
+    metadata = pd.DataFrame([m or {} for m in metadatas]).reindex(columns=["timestamp", "summary"])
+    return {
+        "Date": metadata["timestamp"].fillna("N/A").astype(str).str.slice(0, 10),  # ISO date prefix
+        "Summary": metadata["summary"].fillna("No summary available.")
+    }